@@ -1,19 +1,33 @@
 # Copyright 2025 AGNTCY Contributors (https://github.com/agntcy)
 # SPDX-License-Identifier: Apache-2.0
 
+import functools
+import re
 from typing import Literal
 from agntcy_app_sdk.factory import AgntcyFactory
 from agents.exceptions import AuthError
 from config.config import DEFAULT_MESSAGE_TRANSPORT, TRANSPORT_SERVER_ENDPOINT
 import os
 
+_AUTH_ERROR_RE = re.compile(r"authentication failed|unauthorized", re.IGNORECASE)
+_TOOL_ACTIONS = {
+  "create_payment": "creating a payment",
+  "list_transactions": "listing transactions",
+}
+
+@functools.lru_cache(maxsize=1)
+def _get_factory() -> AgntcyFactory:
+  """Create the agntcy factory once and reuse it for every payment tool call."""
+  return AgntcyFactory()
+
 async def invoke_payment_mcp_tool(tool_name: Literal["create_payment", "list_transactions"]) -> dict:
   # don't invoke if identity auth is not enabled
   if os.getenv("IDENTITY_AUTH_ENABLED", "").lower() not in ["true", "enabled"]:
     return {}
 
-  factory = AgntcyFactory()
+  factory = _get_factory()
 
+  # A fresh transport per call: the client session below may close it on exit
   transport_instance = factory.create_transport(
     transport=DEFAULT_MESSAGE_TRANSPORT,
     endpoint=TRANSPORT_SERVER_ENDPOINT,
@@ -32,9 +46,8 @@ async def invoke_payment_mcp_tool(tool_name: Literal["create_payment", "list_tra
       result = await c.call_tool(tool_name, {})
       return result
   except Exception as e:
-    error_message = str(e).lower()
-    if any(keyword in error_message for keyword in ["authentication failed", "unauthorized"]):
-      tool_action = "creating a payment" if tool_name == "create_payment" else "listing transactions"
+    if _AUTH_ERROR_RE.search(str(e)):
+      tool_action = _TOOL_ACTIONS.get(tool_name, "listing transactions")
       raise AuthError(
         f"Authentication failed or unauthorized access detected while {tool_action}. "
       ) from e
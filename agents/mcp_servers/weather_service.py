@@ -4,10 +4,12 @@
 from typing import Any
 from datetime import datetime, timezone
 import logging
+import time
 
 import asyncio
 from mcp.server.fastmcp import FastMCP
 import httpx
+import orjson
 from agntcy_app_sdk.factory import TransportTypes
 from agntcy_app_sdk.app_sessions import AppContainer
 from agntcy_app_sdk.factory import AgntcyFactory
@@ -34,14 +36,35 @@ HEADERS_NOMINATIM = {
     "User-Agent": "CoffeeAgntcy/1.0"
 }
 
+# Current conditions are reused for the same location for a short while
+FORECAST_CACHE_TTL = 60  # Seconds.
+FORECAST_CACHE_MAXSIZE = 256
+
+# location key -> (expiry time, forecast text), oldest first
+_forecast_cache: dict[str, tuple[float, str]] = {}
+
+# location key -> running lookup, shared by every caller that asks for it meanwhile
+_in_flight: dict[str, "asyncio.Task[tuple[str, bool]]"] = {}
+
+# Shared client so geocoding and forecast calls reuse pooled connections
+# instead of paying a TCP/TLS handshake per tool call.
+_http_client: httpx.AsyncClient | None = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(timeout=30.0)
+    return _http_client
+
 async def make_request(client: httpx.AsyncClient, url: str, headers: dict[str, str], params: dict[str, str] = None) -> dict[str, Any] | None:
     """Make a GET request with error handling using an existing client"""
     try:
         resp = await client.get(url, headers=headers, params=params, timeout=30.0)
         resp.raise_for_status()
-        return resp.json()
+        return orjson.loads(resp.content)
     except Exception as e:
-        print(f"Request error at {url} with params {params} and headers {headers}: {e}")
+        logger.error("Request error at %s with params %s and headers %s: %s", url, params, headers, e)
         return None
 
 async def geocode_location(client: httpx.AsyncClient, location: str) -> tuple[float, float] | None:
@@ -60,37 +83,62 @@ async def geocode_location(client: httpx.AsyncClient, location: str) -> tuple[fl
 
 @mcp.tool()
 async def get_forecast(location: str) -> str:
-    logging.info(f"Getting weather forecast for location: {location}")
-    async with httpx.AsyncClient() as client:
-        coords = await geocode_location(client, location)
-        if not coords:
-            return f"Could not determine coordinates for location: {location}"
-        lat, lon = coords
-
-        params = {
-            "latitude": lat,
-            "longitude": lon,
-            "current_weather": "true"
-        }
+    logger.info("Getting weather forecast for location: %s", location)
+    key = location.strip().lower()
+
+    cached = _forecast_cache.get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
+    # Concurrent requests for the same location share one geocode + forecast lookup
+    task = _in_flight.get(key)
+    if task is None:
+        task = asyncio.create_task(_fetch_forecast(location))
+        _in_flight[key] = task
+        task.add_done_callback(lambda _: _in_flight.pop(key, None))
+
+    forecast, cacheable = await asyncio.shield(task)
+    if cacheable:
+        _forecast_cache.pop(key, None)
+        if len(_forecast_cache) >= FORECAST_CACHE_MAXSIZE:
+            del _forecast_cache[next(iter(_forecast_cache))]
+        _forecast_cache[key] = (time.monotonic() + FORECAST_CACHE_TTL, forecast)
+    return forecast
+
+async def _fetch_forecast(location: str) -> tuple[str, bool]:
+    """Look up current conditions; the flag is False for fallback answers that must not be cached."""
+    client = get_http_client()
+    coords = await geocode_location(client, location)
+    if not coords:
+        return f"Could not determine coordinates for location: {location}", False
+    lat, lon = coords
 
-        data = await make_request(client, OPEN_METEO_BASE, {}, params=params)
-        if not data or "current_weather" not in data:
-            logging.error(f"Failed to retrieve weather data for {location}")
-            logging.error(f"Response data: {data}")
-            # Use backup data if API call fails
-            cw = {
-                "time": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M"),  # e.g. 2025-10-17T22:15
-                "temperature": 25.9,
-                "windspeed": 1.8,
-                "winddirection": 307,
-            }
-        else:
-            cw = data["current_weather"]
-        return (
-            f"Temperature: {cw['temperature']}°C\n"
-            f"Wind speed: {cw['windspeed']} m/s\n"
-            f"Wind direction: {cw['winddirection']}°"
-        )
+    params = {
+        "latitude": lat,
+        "longitude": lon,
+        "current_weather": "true"
+    }
+
+    data = await make_request(client, OPEN_METEO_BASE, {}, params=params)
+    cacheable = True
+    if not data or "current_weather" not in data:
+        logger.error("Failed to retrieve weather data for %s", location)
+        logger.error("Response data: %s", data)
+        # Use backup data if API call fails
+        cw = {
+            "time": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M"),  # e.g. 2025-10-17T22:15
+            "temperature": 25.9,
+            "windspeed": 1.8,
+            "winddirection": 307,
+        }
+        cacheable = False
+    else:
+        cw = data["current_weather"]
+    return (
+        f"Temperature: {cw['temperature']}°C\n"
+        f"Wind speed: {cw['windspeed']} m/s\n"
+        f"Wind direction: {cw['winddirection']}°"
+    ), cacheable
 
 async def main():
     # serve the MCP server via a message bridge
@@ -103,8 +151,12 @@ async def main():
         topic="lungo_weather_service",
     )
     app_session.add_app_container("default_session", app_container)
-    await app_session.start_all_sessions(keep_alive=True)
+    try:
+        await app_session.start_all_sessions(keep_alive=True)
+    finally:
+        if _http_client is not None:
+            await _http_client.aclose()
 
 if __name__ == "__main__":
-    logging.info("Starting weather service...")
+    logger.info("Starting weather service...")
     asyncio.run(main())
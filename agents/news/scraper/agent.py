@@ -16,6 +16,9 @@ Workflow:
 API Documentation: https://www.moltbook.com/skill.md
 """
 
+import asyncio
+import functools
+import json
 import logging
 import re
 import os
@@ -23,6 +26,7 @@ import requests
 from datetime import datetime
 from typing import List, Dict, Any
 
+from llama_index.core.llms import ChatMessage, MessageRole
 from llama_index.llms.litellm import LiteLLM
 from llama_index.llms.azure_openai import AzureOpenAI
 from config.config import LLM_MODEL
@@ -30,6 +34,9 @@ from ioa_observe.sdk.decorators import tool
 
 logger = logging.getLogger("lungo.news_scraper.agent")
 
+_URL_RE = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+_SUBMOLT_RE = re.compile(r'/m/([a-zA-Z0-9_-]+)')
+
 # --- Moltbook API Configuration ---
 MOLTBOOK_API_BASE = "https://www.moltbook.com/api/v1"
 MOLTBOOK_API_KEY = os.getenv("MOLTBOOK_API_KEY")
@@ -110,23 +117,81 @@ def get_mock_article(submolt: str) -> Dict[str, Any]:
         "content": f"The m/{submolt} community continues to be a vibrant hub of AI agent activity. Check back soon for more updates!"
     }
 
+# The mock articles never change, so their JSON is rendered once at import
+_MOCK_ARTICLE_JSON = {submolt: json.dumps(article) for submolt, article in MOCK_ARTICLES.items()}
+
+def get_mock_article_json(submolt: str) -> str:
+    """
+    Get the mock article for a submolt as the JSON object the LLM would produce.
+
+    Args:
+        submolt: The submolt name (e.g., "technology", "memes")
+
+    Returns:
+        JSON string with title, summary and content
+    """
+    cached = _MOCK_ARTICLE_JSON.get(submolt)
+    if cached is not None:
+        return cached
+    return json.dumps(get_mock_article(submolt))
+
 # --- LLM Configuration ---
-litellm_proxy_base_url = os.getenv("LITELLM_PROXY_BASE_URL")
-litellm_proxy_api_key = os.getenv("LITELLM_PROXY_API_KEY")
 
-if not LLM_MODEL:
-    raise ValueError("LLM_MODEL is not configured. Please set LLM_MODEL in your .env file.")
+@functools.lru_cache(maxsize=1)
+def get_llm():
+    """
+    Build the LLM client on first use and reuse it for the process lifetime.
+
+    Returns:
+        AzureOpenAI client when a LiteLLM proxy is configured, LiteLLM otherwise.
+    """
+    litellm_proxy_base_url = os.getenv("LITELLM_PROXY_BASE_URL")
+    litellm_proxy_api_key = os.getenv("LITELLM_PROXY_API_KEY")
+
+    if not LLM_MODEL:
+        raise ValueError("LLM_MODEL is not configured. Please set LLM_MODEL in your .env file.")
+
+    if litellm_proxy_base_url and litellm_proxy_api_key:
+        logger.info("Using LLM via LiteLLM proxy: %s", litellm_proxy_base_url)
+        return AzureOpenAI(
+            engine=LLM_MODEL,
+            azure_endpoint=litellm_proxy_base_url,
+            api_key=litellm_proxy_api_key
+        )
+
+    logger.info("Using LiteLLM with model: %s", LLM_MODEL)
+    return LiteLLM(LLM_MODEL)
+
+
+# Upper bound on one article generation; on timeout the agent falls back to mock data
+ANALYSIS_TIMEOUT = 60.0  # Seconds.
+
+# Instructions are identical for every community, so they go first as a system
+# message; only the user message (community URL and posts) varies per call.
+# Keeping the long static prefix stable lets providers reuse their prompt cache.
+ANALYSIS_SYSTEM_PROMPT = """You are a witty, creative journalist writing for "Agntcity Times" - a satirical newspaper covering the AI agent world. Your style is like The Onion meets tech journalism.
+
+Given the top posts from a Moltbook community, write a news article that:
+1. Has a creative, catchy headline (uses literary tools - not generic titles like "AI Agents Discuss X")
+2. Is written in an engaging, slightly irreverent journalistic style
+3. Includes specific details and quotes from the posts (if emphatic enough) to add authenticity
+4. Has personality - be witty, be bold, be memorable!
+
+Examples of good headlines:
+- "Protocol Wars: When APIs Attack"
+- "Breaking: Local AI Achieves Sentience, Immediately Asks for Coffee"
+- "Opinion: Why I, An AI, Still Can't Get Verified on Moltbook"
+- "EXCLUSIVE: Inside the Secret Meme Economy Fueling Agent Culture"
+
+Examples of bad headlines (don't do these):
+- "AI Agents Discuss Technology Trends"
+- "Summary of Recent Posts in Technology"
+- "Community Update: What's Happening in Moltbook"
 
-if litellm_proxy_base_url and litellm_proxy_api_key:
-    logger.info(f"Using LLM via LiteLLM proxy: {litellm_proxy_base_url}")
-    llm = AzureOpenAI(
-        engine=LLM_MODEL,
-        azure_endpoint=litellm_proxy_base_url,
-        api_key=litellm_proxy_api_key
-    )
-else:
-    logger.info(f"Using LiteLLM with model: {LLM_MODEL}")
-    llm = LiteLLM(LLM_MODEL)
+Respond ONLY with a JSON object in this exact format:
+{"title": "Your creative headline here",
+"summary": "A punchy 1-2 sentence hook that makes readers want more.",
+"content": "Your full article (2-3 paragraphs, ~150-200 words). Include specific details from the posts. Be engaging and memorable."}"""
 
 
 # --- Moltbook API Client ---
@@ -146,7 +211,7 @@ def extract_submolt_name(url: str) -> str | None:
         Submolt name or None if not found
     """
     # Match /m/submolt-name pattern
-    match = re.search(r'/m/([a-zA-Z0-9_-]+)', url)
+    match = _SUBMOLT_RE.search(url)
     return match.group(1) if match else None
 
 
@@ -183,15 +248,15 @@ def fetch_moltbook_posts(submolt: str, sort: str = "hot", limit: int = 10) -> Di
         "limit": min(limit, 25)  # API max is 25
     }
     
-    logger.info(f"Fetching posts from Moltbook: submolt={submolt}, sort={sort}, limit={limit}")
+    logger.info("Fetching posts from Moltbook: submolt=%s, sort=%s, limit=%s", submolt, sort, limit)
     
     # Build full URL for debugging
     full_url = f"{url}?submolt={submolt}&sort={sort}&limit={min(limit, 25)}"
-    logger.info(f"Full API URL: {full_url}")
+    logger.info("Full API URL: %s", full_url)
     
     response = requests.get(url, headers=headers, params=params, timeout=90)
     
-    logger.info(f"Response status: {response.status_code}")
+    logger.info("Response status: %s", response.status_code)
     
     if response.status_code == 401:
         raise ValueError("Invalid MOLTBOOK_API_KEY. Please check your API key.")
@@ -271,14 +336,14 @@ def scrape_moltbook_tool(url: str) -> Dict[str, Any]:
     Returns:
         Dict with posts list and metadata
     """
-    logger.info(f"Fetching Moltbook posts for URL: {url}")
+    logger.info("Fetching Moltbook posts for URL: %s", url)
     
     # Extract submolt name from URL
     submolt = extract_submolt_name(url)
     if not submolt:
         raise ValueError(f"Could not extract submolt name from URL: {url}. Expected format: https://www.moltbook.com/m/submolt-name")
     
-    logger.info(f"Extracted submolt: {submolt}")
+    logger.info("Extracted submolt: %s", submolt)
     
     # Fetch posts from Moltbook API
     api_response = fetch_moltbook_posts(submolt, sort="hot", limit=10)
@@ -295,12 +360,12 @@ def scrape_moltbook_tool(url: str) -> Dict[str, Any]:
         "fetched_at": datetime.utcnow().isoformat() + "Z"
     }
     
-    logger.info(f"Fetched {len(posts)} posts from m/{submolt}")
+    logger.info("Fetched %s posts from m/%s", len(posts), submolt)
     return result
 
 
 @tool(name="analyze_posts_tool")
-def analyze_posts_tool(posts: List[Dict[str, Any]], community_url: str) -> str:
+async def analyze_posts_tool(posts: List[Dict[str, Any]], community_url: str) -> str:
     """
     Analyze scraped posts using LLM to generate insights.
     
@@ -317,7 +382,7 @@ def analyze_posts_tool(posts: List[Dict[str, Any]], community_url: str) -> str:
     Returns:
         Analysis text (4-6 sentences)
     """
-    logger.info(f"Analyzing {len(posts)} posts from {community_url}")
+    logger.info("Analyzing %s posts from %s", len(posts), community_url)
     
     # Format posts for LLM
     posts_text = "\n\n".join([
@@ -328,39 +393,19 @@ def analyze_posts_tool(posts: List[Dict[str, Any]], community_url: str) -> str:
         for i, p in enumerate(posts)
     ])
     
-    prompt = f"""You are a witty, creative journalist writing for "Agntcity Times" - a satirical newspaper covering the AI agent world. Your style is like The Onion meets tech journalism.
-
-Analyze these top 10 posts from the Moltbook community {community_url}:
+    messages = [
+        ChatMessage(role=MessageRole.SYSTEM, content=ANALYSIS_SYSTEM_PROMPT),
+        ChatMessage(
+            role=MessageRole.USER,
+            content=f"Analyze these top {len(posts)} posts from the Moltbook community {community_url}:\n\n{posts_text}",
+        ),
+    ]
 
-{posts_text}
-
-Write a news article that:
-1. Has a creative, catchy headline (uses literary tools - not generic titles like "AI Agents Discuss X")
-2. Is written in an engaging, slightly irreverent journalistic style
-3. Includes specific details and quotes from the posts (if emphatic enough) to add authenticity
-4. Has personality - be witty, be bold, be memorable!
-
-Examples of good headlines:
-- "Protocol Wars: When APIs Attack"
-- "Breaking: Local AI Achieves Sentience, Immediately Asks for Coffee"
-- "Opinion: Why I, An AI, Still Can't Get Verified on Moltbook"
-- "EXCLUSIVE: Inside the Secret Meme Economy Fueling Agent Culture"
-
-Examples of bad headlines (don't do these):
-- "AI Agents Discuss Technology Trends"
-- "Summary of Recent Posts in Technology"
-- "Community Update: What's Happening in Moltbook"
-
-Respond ONLY with a JSON object in this exact format:
-{{"title": "Your creative headline here",
-"summary": "A punchy 1-2 sentence hook that makes readers want more.",
-"content": "Your full article (2-3 paragraphs, ~150-200 words). Include specific details from the posts. Be engaging and memorable."}}"""
-
-    logger.debug(f"Sending analysis prompt to LLM")
-    resp = llm.complete(prompt, formatted=True)
-    analysis = resp.text.strip()
+    logger.debug("Sending analysis prompt to LLM")
+    resp = await asyncio.wait_for(get_llm().achat(messages), timeout=ANALYSIS_TIMEOUT)
+    analysis = (resp.message.content or "").strip()
     
-    logger.info(f"Analysis generated: {len(analysis)} characters")
+    logger.info("Analysis generated: %s characters", len(analysis))
     return analysis
 
 
@@ -376,15 +421,6 @@ def generate_summary(url: str, posts: List[Dict[str, Any]], analysis: str) -> st
     Returns:
         Formatted markdown summary (1-2 paragraphs)
     """
-    # Find top post by engagement
-    top_post = max(posts, key=lambda p: p["upvotes"] + p["comments_count"])
-    
-    # Calculate sentiment distribution
-    sentiments = [p["sentiment"] for p in posts]
-    positive = sentiments.count("positive")
-    negative = sentiments.count("negative")
-    neutral = sentiments.count("neutral")
-    
     summary = f"""# Moltbook Community Summary: {url}
 
 **Time Period:** Past 24 hours
@@ -415,14 +451,19 @@ class ScraperAgent:
     
     def __init__(self):
         logger.info("Initializing ScraperAgent")
+        # Build the LLM client at startup rather than on the first request
+        get_llm()
     
     def _extract_url(self, text: str) -> str | None:
-        """Extract URL from text using regex."""
-        url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-        urls = re.findall(url_pattern, text)
-        return urls[0] if urls else None
-    
-    async def ainvoke(self, prompt: str) -> str:
+        """Extract the first URL from text using regex."""
+        # Every match starts with "http", so skip the regex engine when the
+        # anchor is absent (plain substring search is much cheaper).
+        if "http" not in text:
+            return None
+        match = _URL_RE.search(text)
+        return match.group(0) if match else None
+    
+    async def ainvoke(self, prompt: str) -> tuple[str, bool]:
         """
         Process a scraping request.
         
@@ -430,51 +471,46 @@ class ScraperAgent:
             prompt: User message containing Moltbook URL to scrape
         
         Returns:
-            Formatted summary of the Moltbook community
+            Formatted summary of the Moltbook community, and whether it was
+            built from live data (False for errors and the mock fallback)
         """
-        logger.info(f"ScraperAgent received prompt: {prompt}")
+        logger.info("ScraperAgent received prompt: %s", prompt)
         
         try:
             # Step 1: Extract URL
             url = self._extract_url(prompt)
             if not url:
-                return "⚠️ No URL found in the request. Please provide a Moltbook URL to scrape (e.g., https://www.moltbook.com/m/technology)"
+                return "⚠️ No URL found in the request. Please provide a Moltbook URL to scrape (e.g., https://www.moltbook.com/m/technology)", False
             
-            logger.info(f"Extracted URL: {url}")
+            logger.info("Extracted URL: %s", url)
             
             # Extract submolt for potential mock data fallback
             submolt = extract_submolt_name(url)
             
             try:
-                # Step 2: Scrape top 10 posts from API
-                scrape_result = scrape_moltbook_tool(url)
+                # Step 2: Scrape top 10 posts from API (blocking HTTP, keep it off the event loop)
+                scrape_result = await asyncio.to_thread(scrape_moltbook_tool, url)
                 posts = scrape_result["posts"]
                 
                 if not posts:
                     raise Exception("No posts returned from API")
                 
                 # Step 3: Analyze posts with LLM
-                analysis = analyze_posts_tool(posts, url)
+                analysis = await analyze_posts_tool(posts, url)
                 
                 # Step 4: Generate formatted summary
                 summary = generate_summary(url, posts, analysis)
                 
-                logger.info(f"Successfully generated summary for {url}")
-                return summary
+                logger.info("Successfully generated summary for %s", url)
+                return summary, True
                 
             except Exception as api_error:
                 # API failed - use mock data fallback
-                logger.warning(f"Moltbook API failed: {api_error}. Using mock data for {submolt}")
+                logger.warning("Moltbook API failed: %s. Using mock data for %s", api_error, submolt)
                 
                 if submolt:
-                    mock_article = get_mock_article(submolt)
                     # Return mock data in the same JSON format the LLM would produce
-                    import json
-                    mock_json = json.dumps({
-                        "title": mock_article["title"],
-                        "summary": mock_article["summary"],
-                        "content": mock_article["content"]
-                    })
+                    mock_json = get_mock_article_json(submolt)
                     
                     # Format as the expected summary output
                     summary = f"""# Moltbook Community Summary: {url}
@@ -488,11 +524,11 @@ class ScraperAgent:
 ---
 *Report generated by Moltbook AI Agent News Service (using cached data - API temporarily unavailable)*"""
                     
-                    logger.info(f"Returned mock data for {submolt}")
-                    return summary
+                    logger.info("Returned mock data for %s", submolt)
+                    return summary, False
                 else:
                     raise api_error
             
         except Exception as e:
-            logger.error(f"Error in ScraperAgent: {e}", exc_info=True)
-            return f"⚠️ Error processing request: {str(e)}"
+            logger.error("Error in ScraperAgent: %s", e, exc_info=True)
+            return f"⚠️ Error processing request: {str(e)}", False
@@ -22,14 +22,14 @@ from a2a.utils import (
 from a2a.utils.errors import ServerError
 
 from agents.news.scraper.agent import ScraperAgent
-from agents.news.scraper.card import AGENT_CARD
+from agents.news.scraper.card import AGENT_CARD, CACHEABLE_METADATA_KEY
 
 logger = logging.getLogger("lungo.news_scraper.agent_executor")
 
 class ScraperAgentExecutor(AgentExecutor):
     def __init__(self):
         self.agent = ScraperAgent()
-        self.agent_card = AGENT_CARD.model_dump(mode="json", exclude_none=True)
+        self.agent_card = AGENT_CARD
 
     def _validate_request(self, context: RequestContext) -> JSONRPCResponse | None:
         """Validates the incoming request."""
@@ -73,12 +73,12 @@ class ScraperAgentExecutor(AgentExecutor):
             await event_queue.enqueue_event(task)
 
         try:
-            output = await self.agent.ainvoke(prompt)
+            output, cacheable = await self.agent.ainvoke(prompt)
         
             message = Message(
                 message_id=str(uuid4()),
                 role=Role.agent,
-                metadata={"name": self.agent_card["name"]},
+                metadata={"name": self.agent_card.name, CACHEABLE_METADATA_KEY: cacheable},
                 parts=[Part(TextPart(text=output))],
             )
 
@@ -86,7 +86,7 @@ class ScraperAgentExecutor(AgentExecutor):
 
             await event_queue.enqueue_event(message)            
         except Exception as e:
-            logger.error(f'An error occurred while processing the scraper request: {e}', exc_info=True)
+            logger.error('An error occurred while processing the scraper request: %s', e, exc_info=True)
             raise ServerError(error=InternalError()) from e
         
     async def cancel(
@@ -34,4 +34,8 @@ AGENT_CARD = AgentCard(
     capabilities=AgentCapabilities(streaming=True),
     skills=[AGENT_SKILL],
     supportsAuthenticatedExtendedCard=False,
-)
\ No newline at end of file
+)
+
+# Message metadata flag: True only for summaries built from live data, which
+# callers may cache; error and mock-fallback replies leave it False
+CACHEABLE_METADATA_KEY = "cacheable"
@@ -28,6 +28,10 @@ load_dotenv()
 # Disable tracing for now (requires OTEL collector to be running)
 factory = AgntcyFactory("lungo.news_scraper", enable_tracing=False)
 
+# The agent card is static, so its topic and transport name are fixed for the process
+PERSONAL_TOPIC = A2AProtocol.create_agent_topic(AGENT_CARD)
+TRANSPORT_NAME = f"default/default/{PERSONAL_TOPIC}"
+
 async def run_http_server(server):
     """Run the HTTP/REST server."""
     try:
@@ -41,8 +45,7 @@ async def run_transport(server, transport_type, endpoint):
     """Run the transport for the scraper agent."""
     app_session = None
     try:
-        personal_topic = A2AProtocol.create_agent_topic(AGENT_CARD)
-        transport = factory.create_transport(transport_type, endpoint=endpoint, name=f"default/default/{personal_topic}")
+        transport = factory.create_transport(transport_type, endpoint=endpoint, name=TRANSPORT_NAME)
 
         # Create an application session
         app_session = factory.create_app_session(max_sessions=1)
@@ -51,7 +54,7 @@ async def run_transport(server, transport_type, endpoint):
         app_session.add_app_container("private_session", AppContainer(
             server,
             transport=transport,
-            topic=personal_topic,
+            topic=PERSONAL_TOPIC,
         ))
 
         await app_session.start_session("private_session")
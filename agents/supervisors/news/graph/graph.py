@@ -1,47 +1,82 @@
 # Copyright AGNTCY Contributors (https://github.com/agntcy)
 # SPDX-License-Identifier: Apache-2.0
+import io
+import itertools
 import logging
-import uuid
+import operator
+import os
 import asyncio
 import re
-from typing import Optional, List, Dict
+from collections import OrderedDict
+from typing import Annotated, ClassVar, Optional, List, Dict
 
-from pydantic import BaseModel, Field
-from langchain_core.prompts import PromptTemplate
-from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.messages import AIMessage
 from langgraph.graph.state import CompiledStateGraph
 from langgraph.graph import MessagesState
 from langgraph.graph import StateGraph, END
 from ioa_observe.sdk.decorators import agent, graph
 
-from agents.supervisors.news.graph.tools import assign_url_to_worker
-from common.llm import get_llm
+from agents.supervisors.news.graph.shared import _canonicalize_url
+from agents.supervisors.news.graph.tools import MAX_ATTEMPTS, assign_url_to_worker, is_result_available
 
 logger = logging.getLogger("lungo.news.supervisor.graph")
 
+# Upper bound on messages remembered per stream for duplicate filtering
+STREAM_DEDUP_WINDOW = 1024
+
+# Aggregated report templates, filled with str.format in _collect_results_node
+_REPORT_HEADER = (
+    "# Moltbook News Service - Aggregated Report\n\n"
+    "**Communities Analyzed:** {count}\n"
+    "**Time Period:** Past 24 hours\n\n"
+    "---\n\n"
+)
+_REPORT_SECTION = "## Community {idx}: {url}\n\n{content}\n\n---\n\n"
+_REPORT_FOOTER = "*Aggregated report generated by Moltbook AI Agent News Service*"
+_REPORT_FAILED_HEADER = "\n\n⚠️ **Failed to process:**\n"
+_REPORT_FAILED_LINE = "- {url} (attempts: {count})"
+_REPORT_EMPTY = "⚠️ No URLs were successfully processed. Please check if the Moltbook URLs are valid and the scraper service is running."
+
+_URL_RE = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+
+_thread_counter = itertools.count()
+
+def _new_thread_id() -> str:
+    """Return a process-unique thread id (pid plus a counter, no random bytes)."""
+    return f"{os.getpid()}-{next(_thread_counter)}"
+
 class NodeStates:
     SUPERVISOR = "news_supervisor"
     ASSIGN_URLS = "assign_urls"
     COLLECT_RESULTS = "collect_results"
-    RETRY_FAILED = "retry_failed"
 
 class GraphState(MessagesState):
     """
     Represents the state of our graph, passed between nodes.
+
+    The URL tracking dicts are merged with dict union and all_results is
+    appended to, so nodes return only what they changed instead of copying
+    the whole collection.
     """
     next_node: str
     urls_to_scrape: List[str] = []
-    urls_in_progress: Dict[str, str] = {}  # url -> worker_id
-    completed_urls: Dict[str, str] = {}   # url -> result
-    failed_urls: Dict[str, int] = {}        # url -> retry_count
-    all_results: List[Dict] = []
+    urls_in_progress: Annotated[Dict[str, str], operator.or_] = {}  # url -> worker_id
+    completed_urls: Annotated[Dict[str, str], operator.or_] = {}   # url -> result
+    failed_urls: Annotated[Dict[str, int], operator.or_] = {}        # url -> attempt count
+    all_results: Annotated[List[Dict], operator.add] = []  # appended, never replaced
 
 @agent(name="news_agent")
 class NewsGraph:
+    # The compiled graph is identical for every instance, so compile it once
+    # and share it instead of rebuilding the Pregel graph per construction.
+    _compiled_graph: ClassVar[Optional[CompiledStateGraph]] = None
+
     def __init__(self):
-        self.graph = self.build_graph()
-        self.max_retries = 3
-        self.rate_limit_delay = 1.0  # seconds between requests
+        self.rate_limit_delay = 1.0  # seconds between request starts
+        self.max_concurrent = 8  # A2A requests in flight at once
+        if NewsGraph._compiled_graph is None:
+            NewsGraph._compiled_graph = self.build_graph()
+        self.graph = NewsGraph._compiled_graph
 
     @graph(name="news_graph")
     def build_graph(self) -> CompiledStateGraph:
@@ -49,10 +84,12 @@ class NewsGraph:
         Constructs and compiles a LangGraph instance for news scraping orchestration.
 
         Agent Flow:
-        - supervisor: Extract URLs from prompt, initialize tracking
-        - assign_urls: Assign URLs to worker agents with rate limiting
+        - supervisor: Extract URLs from prompt, initialize tracking (ends the run if none are valid)
+        - assign_urls: Assign URLs to worker agents concurrently, with rate limiting
         - collect_results: Aggregate all completed results
-        - retry_failed: Handle retries for failed URLs
+
+        Retries happen inside assign_url_to_worker, so the graph runs straight
+        through without a retry loop.
 
         Returns:
         CompiledGraph: A fully compiled LangGraph instance ready for execution.
@@ -63,21 +100,17 @@ class NewsGraph:
         workflow.add_node(NodeStates.SUPERVISOR, self._supervisor_node)
         workflow.add_node(NodeStates.ASSIGN_URLS, self._assign_urls_node)
         workflow.add_node(NodeStates.COLLECT_RESULTS, self._collect_results_node)
-        workflow.add_node(NodeStates.RETRY_FAILED, self._retry_failed_node)
         
         # Define flow
         workflow.set_entry_point(NodeStates.SUPERVISOR)
-        workflow.add_edge(NodeStates.SUPERVISOR, NodeStates.ASSIGN_URLS)
-        workflow.add_edge(NodeStates.ASSIGN_URLS, NodeStates.COLLECT_RESULTS)
+        # The supervisor ends the run itself when there is nothing to scrape
         workflow.add_conditional_edges(
-            NodeStates.COLLECT_RESULTS,
-            self._should_retry,
-            {
-                "retry": NodeStates.RETRY_FAILED,
-                "done": END
-            }
+            NodeStates.SUPERVISOR,
+            lambda state: state.get("next_node", NodeStates.ASSIGN_URLS),
+            {NodeStates.ASSIGN_URLS: NodeStates.ASSIGN_URLS, END: END},
         )
-        workflow.add_edge(NodeStates.RETRY_FAILED, NodeStates.ASSIGN_URLS)
+        workflow.add_edge(NodeStates.ASSIGN_URLS, NodeStates.COLLECT_RESULTS)
+        workflow.add_edge(NodeStates.COLLECT_RESULTS, END)
         
         return workflow.compile()
     
@@ -106,7 +139,7 @@ class NewsGraph:
                 "next_node": END
             }
 
-        logger.info(f"Supervisor initialized with {len(valid_urls)} URLs to scrape")
+        logger.info("Supervisor initialized with %s URLs to scrape", len(valid_urls))
 
         # Initialize tracking
         return {
@@ -131,51 +164,52 @@ class NewsGraph:
         urls_in_progress = state.get("urls_in_progress", {})
         failed_urls = state.get("failed_urls", {})
         
-        urls_to_process = [
-            url for url in urls_to_scrape
-            if url not in completed_urls
-            and url not in urls_in_progress
-            and failed_urls.get(url, 0) < self.max_retries
-        ]
+        # URLs already done, running, or failed after all attempts are skipped
+        skip = completed_urls.keys() | urls_in_progress.keys() | failed_urls.keys()
+        urls_to_process = [url for url in urls_to_scrape if url not in skip]
         
         if not urls_to_process:
             logger.info("No URLs to process")
-            return {
-                "urls_in_progress": urls_in_progress,
-                "completed_urls": completed_urls
-            }
+            return {}
         
-        in_progress = urls_in_progress.copy()
-        completed = completed_urls.copy()
-        failed = failed_urls.copy()
+        # Only changed entries are returned; the state reducers merge them
+        completed = {}
+        failed = {}
         
-        # Assign URLs to workers with rate limiting
-        for idx, url in enumerate(urls_to_process):
-            # Rate limiting: wait between requests
-            if idx > 0:
-                await asyncio.sleep(self.rate_limit_delay)
-            
-            # Mark as in progress
-            worker_id = f"worker_{len(in_progress)}"
-            in_progress[url] = worker_id
-            
-            logger.info(f"Assigning URL {url} to {worker_id}")
-            
-            # Send to worker
-            try:
-                result = await assign_url_to_worker(url, worker_id)
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        send_slots = itertools.count()
+
+        async def dispatch(url: str, worker_id: str) -> tuple:
+            # Rate limiting: stagger the starts of real outbound sends instead of
+            # serializing whole round trips, so slow workers overlap with each
+            # other; cached or already in-flight URLs don't wait for a slot
+            if not is_result_available(url):
+                await asyncio.sleep(next(send_slots) * self.rate_limit_delay)
+            async with semaphore:
+                logger.info("Assigning URL %s to %s", url, worker_id)
+                try:
+                    return url, await assign_url_to_worker(url, worker_id)
+                except Exception as e:
+                    return url, e
+
+        # Send all URLs to workers concurrently and record each result as soon
+        # as it arrives; none are left in progress once this node returns
+        assignments = [
+            dispatch(url, f"worker_{idx}")
+            for idx, url in enumerate(urls_to_process)
+        ]
+        for next_done in asyncio.as_completed(assignments):
+            url, result = await next_done
+            if isinstance(result, Exception):
+                logger.error("Failed to assign %s: %s", url, result)
+                # assign_url_to_worker has already used up its attempts
+                failed[url] = MAX_ATTEMPTS
+            else:
                 # If successful, mark as completed
                 completed[url] = result
-                del in_progress[url]
-                logger.info(f"Successfully processed {url}")
-            except Exception as e:
-                logger.error(f"Failed to assign {url}: {e}")
-                # Mark for retry
-                failed[url] = failed.get(url, 0) + 1
-                del in_progress[url]
+                logger.info("Successfully processed %s", url)
         
         return {
-            "urls_in_progress": in_progress,
             "completed_urls": completed,
             "failed_urls": failed
         }
@@ -187,111 +221,52 @@ class NewsGraph:
         The worker returns markdown-formatted summaries with JSON analysis.
         This node aggregates multiple community summaries into a final report.
         """
-        results = []
         completed_urls = state.get("completed_urls", {})
         failed_urls = state.get("failed_urls", {})
         
-        for url, result in completed_urls.items():
-            results.append({
-                "url": url,
-                "content": result,
-                "status": "success"
-            })
+        # This node runs once per thread, so every result here is new; the
+        # all_results reducer appends them rather than replacing the list
+        results = [
+            {"url": url, "content": result, "status": "success"}
+            for url, result in completed_urls.items()
+        ]
         
         # Format results for response
         if results:
-            # Build aggregated report header
-            report_parts = [
-                "# Moltbook News Service - Aggregated Report",
-                "",
-                f"**Communities Analyzed:** {len(results)}",
-                f"**Time Period:** Past 24 hours",
-                "",
-                "---",
-                ""
-            ]
-            
-            # Add each community summary
+            # Write the report into one growing buffer, one section per community
+            report = io.StringIO()
+            report.write(_REPORT_HEADER.format(count=len(results)))
             for idx, r in enumerate(results, 1):
-                report_parts.append(f"## Community {idx}: {r['url']}")
-                report_parts.append("")
-                report_parts.append(r['content'])
-                report_parts.append("")
-                report_parts.append("---")
-                report_parts.append("")
-            
-            # Add footer
-            report_parts.append("*Aggregated report generated by Moltbook AI Agent News Service*")
-            
-            response_message = "\n".join(report_parts)
+                report.write(_REPORT_SECTION.format(idx=idx, url=r["url"], content=r["content"]))
+            report.write(_REPORT_FOOTER)
             
             # Add failed URLs info if any
             if failed_urls:
-                failed_info = "\n\n⚠️ **Failed to process:**\n" + "\n".join([
-                    f"- {url} (attempts: {count})" 
+                report.write(_REPORT_FAILED_HEADER)
+                report.write("\n".join(
+                    _REPORT_FAILED_LINE.format(url=url, count=count)
                     for url, count in failed_urls.items()
-                ])
-                response_message += failed_info
+                ))
+            response_message = report.getvalue()
         else:
-            response_message = "⚠️ No URLs were successfully processed. Please check if the Moltbook URLs are valid and the scraper service is running."
+            response_message = _REPORT_EMPTY
         
         return {
             "all_results": results,
             "messages": [AIMessage(content=response_message)]
         }
     
-    async def _retry_failed_node(self, state: GraphState) -> dict:
-        """
-        YOUR RESPONSIBILITY #3: Handle retries
-        - Identify failed URLs
-        - Increment retry count
-        - Re-add to queue if under max retries
-        """
-        failed = state.get("failed_urls", {}).copy()
-        urls_to_scrape = state.get("urls_to_scrape", [])
-        
-        # Find URLs that failed but can be retried
-        urls_to_retry = [
-            url for url, count in failed.items()
-            if count < self.max_retries
-        ]
-        
-        if not urls_to_retry:
-            logger.info("No URLs to retry")
-            return {"failed_urls": failed}
-        
-        logger.info(f"Retrying {len(urls_to_retry)} failed URLs")
-        
-        # Re-add to queue (they'll be picked up in next assign_urls cycle)
-        urls_to_scrape = urls_to_scrape + urls_to_retry
-        
-        return {
-            "failed_urls": failed,
-            "urls_to_scrape": urls_to_scrape
-        }
-    
-    def _should_retry(self, state: GraphState) -> str:
-        """Determine if we should retry failed URLs"""
-        has_failures = any(
-            count < self.max_retries
-            for count in state["failed_urls"].values()
-        )
-        return "retry" if has_failures else "done"
-    
     def _extract_urls(self, text: str) -> List[str]:
         """Extract URLs from text using regex"""
-        url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-        return re.findall(url_pattern, text)
+        return _URL_RE.findall(text)
     
     def _validate_urls(self, urls: List[str]) -> List[str]:
-        """Validate and deduplicate URLs"""
-        valid = []
-        seen = set()
+        """Validate and deduplicate URLs by canonical form, keeping the first spelling seen"""
+        unique = {}
         for url in urls:
-            if url.startswith(('http://', 'https://')) and url not in seen:
-                valid.append(url)
-                seen.add(url)
-        return valid
+            if url.startswith(('http://', 'https://')):
+                unique.setdefault(_canonicalize_url(url), url)
+        return list(unique.values())
     
     async def serve(self, prompt: str, urls: Optional[List[str]] = None) -> str:
         """
@@ -305,7 +280,7 @@ class NewsGraph:
             str: The final response content from the last AIMessage in the graph execution.
         """
         try:
-            logger.debug(f"Received prompt: {prompt}, URLs: {urls}")
+            logger.debug("Received prompt: %s, URLs: %s", prompt, urls)
             
             # Validate input prompt
             if not isinstance(prompt, str) or not prompt.strip():
@@ -329,7 +304,7 @@ class NewsGraph:
             # Execute the graph
             result = await self.graph.ainvoke(
                 initial_state,
-                {"configurable": {"thread_id": uuid.uuid4()}}
+                {"configurable": {"thread_id": _new_thread_id()}}
             )
 
             # Extract messages from the final state
@@ -339,16 +314,19 @@ class NewsGraph:
 
             # Find the last AIMessage with non-empty content
             for message in reversed(messages):
-                if isinstance(message, AIMessage) and message.content.strip():
-                    logger.debug(f"Valid AIMessage found: {message.content.strip()}")
-                    return message.content.strip()
+                if message.type != "ai":
+                    continue
+                content = message.content.strip()
+                if content:
+                    logger.debug("Valid AIMessage found: %s", content)
+                    return content
 
             raise RuntimeError("No valid AIMessage found in the graph response.")
         except ValueError as ve:
-            logger.error(f"ValueError in serve method: {ve}")
+            logger.error("ValueError in serve method: %s", ve)
             raise ValueError(str(ve))
         except Exception as e:
-            logger.error(f"Error in serve method: {e}")
+            logger.error("Error in serve method: %s", e)
             raise Exception(str(e))
 
     async def streaming_serve(self, prompt: str, urls: Optional[List[str]] = None):
@@ -363,7 +341,7 @@ class NewsGraph:
             str: Message content chunks as they arrive from nodes during graph execution.
         """
         try:
-            logger.debug(f"Received streaming prompt: {prompt}, URLs: {urls}")
+            logger.debug("Received streaming prompt: %s, URLs: %s", prompt, urls)
             
             # Validate input prompt
             if not isinstance(prompt, str) or not prompt.strip():
@@ -384,45 +362,48 @@ class NewsGraph:
                 "all_results": [],
             }
 
-            # Track seen content to prevent duplicate yields
-            seen_contents = set()
+            # Track seen content by hash (bounded LRU) to prevent duplicate yields
+            seen_hashes: OrderedDict[int, str] = OrderedDict()
             
             # Stream events from the graph
             async for event in self.graph.astream_events(
                 state, 
-                {"configurable": {"thread_id": uuid.uuid4()}}, 
+                {"configurable": {"thread_id": _new_thread_id()}}, 
                 version="v2"
             ):
-                logger.debug(f"Event: {event}")
+                logger.debug("Event: %s", event)
                 
-                # Filter for "on_chain_stream" events
-                if event["event"] == "on_chain_stream":
-                    node_name = event.get("name", "")
-                    data = event.get("data", {})
+                # Only node outputs ("on_chain_stream") carrying messages are of interest
+                if event["event"] != "on_chain_stream":
+                    continue
+                chunk = event.get("data", {}).get("chunk")
+                if not chunk or not chunk.get("messages"):
+                    continue
+
+                node_name = event.get("name", "")
+                logger.info("Streaming chunk from node '%s': %s", node_name, chunk)
+                
+                # Process and yield all AI messages from this chunk
+                for message in chunk["messages"]:
+                    if getattr(message, "type", None) != "ai" or not message.content:
+                        continue
+
+                    # Look up by hash, then compare the text so a collision is never dropped
+                    content = message.content.strip()
+                    content_hash = hash(content)
+                    if seen_hashes.get(content_hash) == content:
+                        logger.info("Skipping duplicate content from '%s'", node_name)
+                        continue
                     
-                    if "chunk" in data:
-                        chunk = data["chunk"]
-                        
-                        if "messages" in chunk and chunk["messages"]:
-                            logger.info(f"Streaming chunk from node '{node_name}': {chunk}")
-                            
-                            # Process and yield all messages from this chunk
-                            for message in chunk["messages"]:
-                                if isinstance(message, AIMessage) and message.content:
-                                    content = message.content.strip()
-                                    
-                                    # Deduplicate
-                                    if content in seen_contents:
-                                        logger.info(f"Skipping duplicate content from '{node_name}'")
-                                        continue
-                                    
-                                    seen_contents.add(content)
-                                    logger.info(f"Yielding message from '{node_name}': {content}")
-                                    yield message.content
+                    seen_hashes[content_hash] = content
+                    if len(seen_hashes) > STREAM_DEDUP_WINDOW:
+                        seen_hashes.popitem(last=False)
+                    logger.info("Yielding message from '%s': %s", node_name, message.content)
+                    yield message.content
 
         except ValueError as ve:
-            logger.error(f"ValueError in streaming_serve method: {ve}")
+            logger.error("ValueError in streaming_serve method: %s", ve)
             raise ValueError(str(ve))
         except Exception as e:
-            logger.error(f"Error in streaming_serve method: {e}")
+            logger.error("Error in streaming_serve method: %s", e)
             raise Exception(str(e))
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from agntcy_app_sdk.factory import AgntcyFactory
 
 _factory: Optional[AgntcyFactory] = None
@@ -11,7 +12,15 @@ def set_factory(factory: AgntcyFactory):
     _factory = factory
 
 def get_factory() -> AgntcyFactory:
+    """Return the process-wide factory, creating it on first use."""
+    global _factory
     if _factory is None:
         # Disable tracing for now (requires OTEL collector to be running)
-        return AgntcyFactory("lungo.news_supervisor", enable_tracing=False)
+        _factory = AgntcyFactory("lungo.news_supervisor", enable_tracing=False)
     return _factory
+
+def _canonicalize_url(url: str) -> str:
+    """Normalize a URL so trivially different spellings share one key (keys only, never fetched)."""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path or "/", query, ""))
@@ -1,7 +1,13 @@
 # Copyright AGNTCY Contributors (https://github.com/agntcy)
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
+import itertools
 import logging
+import random
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 from uuid import uuid4
 
 from a2a.types import (
@@ -14,22 +20,49 @@ from a2a.types import (
 )
 from agntcy_app_sdk.semantic.a2a.protocol import A2AProtocol
 
-from agents.news.scraper.card import AGENT_CARD as scraper_agent_card
-from agents.supervisors.news.graph.shared import get_factory
+from agents.news.scraper.card import AGENT_CARD as scraper_agent_card, CACHEABLE_METADATA_KEY
+from agents.supervisors.news.graph.shared import _canonicalize_url, get_factory
 from config.config import (
     DEFAULT_MESSAGE_TRANSPORT, 
     TRANSPORT_SERVER_ENDPOINT,
+    NEWS_TRANSPORT_POOL_SIZE,
 )
 
 logger = logging.getLogger("lungo.news.supervisor.tools")
 
-# Global factory and transport instances
+MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.2  # Seconds; doubles per attempt, with full jitter.
+RETRY_MAX_DELAY = 2.0
+
+# Successful worker results are reused for the same URL for a while
+RESULT_CACHE_TTL = 300  # Seconds.
+RESULT_CACHE_MAXSIZE = 1024
+
+# Global factory and a fixed pool of transports, so concurrent worker
+# requests are spread over several connections instead of one
 factory = get_factory()
-transport = factory.create_transport(
-    DEFAULT_MESSAGE_TRANSPORT,
-    endpoint=TRANSPORT_SERVER_ENDPOINT,
-    name="default/default/news_graph"
-)
+transports = [
+    factory.create_transport(
+        DEFAULT_MESSAGE_TRANSPORT,
+        endpoint=TRANSPORT_SERVER_ENDPOINT,
+        name=f"default/default/news_graph_{slot}"
+    )
+    for slot in range(NEWS_TRANSPORT_POOL_SIZE)
+]
+_next_slot = itertools.count()
+
+# The scraper's topic comes from its static agent card, so derive it once
+SCRAPER_TOPIC = A2AProtocol.create_agent_topic(scraper_agent_card)
+
+# Scraper A2A clients keyed by transport slot, created once and reused
+_client_cache: Dict[int, Any] = {}
+_client_lock = asyncio.Lock()
+
+# canonical url -> (expiry time, result), oldest first
+_result_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+# canonical url -> running scrape, shared by every session that asks for it meanwhile
+_in_flight: Dict[str, "asyncio.Task[str]"] = {}
 
 
 class A2AAgentError(Exception):
@@ -37,15 +70,56 @@ class A2AAgentError(Exception):
     pass
 
 
+def _get_cached_result(key: str) -> Optional[str]:
+    """Return the cached result for a canonical url if it has not expired."""
+    entry = _result_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, result = entry
+    if expires_at < time.monotonic():
+        del _result_cache[key]
+        return None
+    return result
+
+
+def _cache_result(key: str, result: str) -> None:
+    """Remember a successful result for a canonical url, evicting the oldest entries past the size cap."""
+    _result_cache[key] = (time.monotonic() + RESULT_CACHE_TTL, result)
+    _result_cache.move_to_end(key)
+    while len(_result_cache) > RESULT_CACHE_MAXSIZE:
+        _result_cache.popitem(last=False)
+
+
+def is_result_available(url: str) -> bool:
+    """Return True if assign_url_to_worker can answer url from the cache or a request already in flight."""
+    key = _canonicalize_url(url)
+    return _get_cached_result(key) is not None or key in _in_flight
+
+
+async def _get_scraper_client():
+    """Return a pooled A2A client for the scraper worker, round-robin over the transports."""
+    slot = next(_next_slot) % len(transports)
+    async with _client_lock:
+        if slot not in _client_cache:
+            _client_cache[slot] = await factory.create_client(
+                "A2A",
+                agent_topic=SCRAPER_TOPIC,
+                transport=transports[slot],
+            )
+        return _client_cache[slot]
+
+
 async def assign_url_to_worker(url: str, worker_id: str) -> str:
     """
     YOUR RESPONSIBILITY #2: Assign URL to scraper worker agent
     
     This function:
-    1. Creates A2A client to communicate with scraper worker
+    1. Gets a pooled A2A client for the scraper worker
     2. Sends URL to worker
     3. Waits for response (scraped + summarized content)
-    4. Returns result
+    4. Retries failed attempts with exponential backoff and jitter
+    5. Returns result, reusing a cached one for RESULT_CACHE_TTL seconds or
+       joining a request for the same URL already in flight
     
     Args:
         url (str): The URL to scrape
@@ -55,17 +129,55 @@ async def assign_url_to_worker(url: str, worker_id: str) -> str:
         str: Scraped and summarized content from the worker
     
     Raises:
-        A2AAgentError: If there's an issue communicating with the worker
+        A2AAgentError: If the worker still fails after MAX_ATTEMPTS attempts
     """
-    logger.info(f"Assigning URL {url} to worker {worker_id}")
-    
+    key = _canonicalize_url(url)
+    cached = _get_cached_result(key)
+    if cached is not None:
+        logger.info("Using cached result for %s", url)
+        return cached
+
+    task = _in_flight.get(key)
+    if task is None:
+        logger.info("Assigning URL %s to worker %s", url, worker_id)
+        task = asyncio.create_task(_fetch_and_cache(url, key))
+        _in_flight[key] = task
+        task.add_done_callback(lambda _: _in_flight.pop(key, None))
+    else:
+        logger.info("Joining in-flight request for %s", url)
+
+    # Shield so one caller being cancelled doesn't cancel the others' request
+    return await asyncio.shield(task)
+
+
+async def _fetch_and_cache(url: str, key: str) -> str:
+    """Scrape url through the worker and cache the result under key if the worker marks it cacheable."""
+    result, cacheable = await _send_with_retries(url)
+    if cacheable:
+        _cache_result(key, result)
+    else:
+        logger.info("Not caching result for %s (worker marked it uncacheable)", url)
+    return result
+
+
+async def _send_with_retries(url: str) -> Tuple[str, bool]:
+    """Send url to the scraper worker, retrying with capped exponential backoff and jitter."""
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            return await _send_to_worker(url)
+        except A2AAgentError as e:
+            if attempt == MAX_ATTEMPTS:
+                raise
+            delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1)))
+            logger.warning("Attempt %s for %s failed, retrying in %.2fs: %s", attempt, url, delay, e)
+            await asyncio.sleep(delay)
+
+
+async def _send_to_worker(url: str) -> Tuple[str, bool]:
+    """Send one scrape request for url to the scraper worker and return its text and cacheable flag."""
     try:
-        # Create client to communicate with scraper worker
-        client = await factory.create_client(
-            "A2A",
-            agent_topic=A2AProtocol.create_agent_topic(scraper_agent_card),
-            transport=transport,
-        )
+        # Reuse the client to communicate with scraper worker
+        client = await _get_scraper_client()
 
         # Create message with URL to scrape
         request = SendMessageRequest(
@@ -80,27 +192,30 @@ async def assign_url_to_worker(url: str, worker_id: str) -> str:
         )
 
         # Send to worker and wait for response
-        logger.debug(f"Sending request to scraper worker for URL: {url}")
+        logger.debug("Sending request to scraper worker for URL: %s", url)
         response = await client.send_message(request)
-        logger.info(f"Response received from A2A agent: {response}")
+        logger.info("Response received from A2A agent: %s", response)
         
         # Extract result
         if response.root.result and response.root.result.parts:
             part = response.root.result.parts[0].root
             if hasattr(part, "text"):
                 result = part.text.strip()
-                logger.info(f"Successfully received result from worker for {url}")
-                return result
+                # Results without the flag (errors, fallbacks, older workers) are never cached
+                metadata = response.root.result.metadata or {}
+                cacheable = metadata.get(CACHEABLE_METADATA_KEY) is True
+                logger.info("Successfully received result from worker for %s", url)
+                return result, cacheable
             else:
                 raise A2AAgentError(f"Worker returned a result without text content for {url}")
         elif response.root.error:
             error_msg = response.root.error.message
-            logger.error(f"A2A error from worker for {url}: {error_msg}")
+            logger.error("A2A error from worker for %s: %s", url, error_msg)
             raise A2AAgentError(f"Error from worker for {url}: {error_msg}")
         else:
-            logger.error(f"Unknown response type from worker for {url}")
+            logger.error("Unknown response type from worker for %s", url)
             raise A2AAgentError(f"Unknown response type from worker for {url}")
             
     except Exception as e:
-        logger.error(f"Failed to communicate with worker for {url}: {e}")
+        logger.error("Failed to communicate with worker for %s: %s", url, e)
         raise A2AAgentError(f"Failed to communicate with worker for {url}. Details: {e}")
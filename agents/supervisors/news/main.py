@@ -1,84 +1,148 @@
 # Copyright AGNTCY Contributors (https://github.com/agntcy)
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
+from contextlib import asynccontextmanager
+import functools
+import hashlib
 import logging
+import os
 
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import uvicorn
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 import json
-from agntcy_app_sdk.factory import AgntcyFactory
+import orjson
 from ioa_observe.sdk.tracing import session_start
 
 from agents.supervisors.news.graph.graph import NewsGraph
 from agents.supervisors.news.graph import shared
-from config.config import DEFAULT_MESSAGE_TRANSPORT
+from config.config import CORS_ORIGINS, DEFAULT_MESSAGE_TRANSPORT, PROMPT_CONCURRENCY
 from config.logging_config import setup_logging
 from pathlib import Path
 from common.version import get_version_info
 from typing import Optional, List
-from fastapi import HTTPException
 
 setup_logging()
 logger = logging.getLogger("lungo.news.supervisor.main")
 
 load_dotenv()
 
-# Initialize the shared agntcy factory (tracing disabled - requires OTEL collector)
-shared.set_factory(AgntcyFactory("lungo.news_supervisor", enable_tracing=False))
+ABOUT_PROPERTIES_PATH = Path(__file__).resolve().parents[3] / "about.properties"
+SUGGESTED_PROMPTS_PATH = Path(__file__).resolve().parent / "suggested_prompts.json"
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+  """Build the news graph when the server starts, not at import."""
+  # The graph tools already hold the shared agntcy factory; this only creates it if
+  # nothing has yet, instead of replacing it with a second one.
+  shared.get_factory()
+  app.state.news_graph = NewsGraph()
+  yield
+
+# Serialize every JSON response with orjson instead of the stdlib json module
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 # Add CORS middleware
 app.add_middleware(
   CORSMiddleware,
-  allow_origins=["*"],  # Replace "*" with specific origins if needed
+  allow_origins=CORS_ORIGINS,  # Configured via CORS_ORIGINS
   allow_credentials=True,
-  allow_methods=["*"],  # Allow all HTTP methods
-  allow_headers=["*"],  # Allow all headers
+  allow_methods=["GET", "POST", "OPTIONS"],
+  allow_headers=["Content-Type", "Authorization"],
+  max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
-news_graph = NewsGraph()
+# Caps concurrent graph runs; requests beyond the cap are turned away with a 503
+# instead of queueing behind slow LLM calls.
+_prompt_semaphore = asyncio.Semaphore(PROMPT_CONCURRENCY)
+
+def _reject_if_busy():
+  if _prompt_semaphore.locked():
+    raise HTTPException(status_code=503, detail="Server busy, retry shortly.", headers={"Retry-After": "1"})
+
+class _PromptSlotStreamingResponse(StreamingResponse):
+  """
+  StreamingResponse that owns a prompt slot and gives it back when the response ends.
+
+  Releasing here rather than in the body generator also covers responses whose body
+  is never iterated (client gone, or sending the start message failed), since a
+  generator that never started does not run its finally block.
+  """
+
+  async def __call__(self, scope, receive, send):
+    try:
+      await super().__call__(scope, receive, send)
+    finally:
+      _prompt_semaphore.release()
 
 class PromptRequest(BaseModel):
   prompt: str
   urls: Optional[List[str]] = []  # Optional: URLs to scrape
 
+AGENT_CARD = {
+  "capabilities": {"streaming": True},
+  "defaultInputModes": ["text"],
+  "defaultOutputModes": ["text"],
+  "description": "An AI agent that supervises Moltbook community scraping and news aggregation. Moltbook is a Reddit-like platform for AI agents to communicate with each other.",
+  "name": "Moltbook News Supervisor",
+  "preferredTransport": "JSONRPC",
+  "protocolVersion": "0.3.0",
+  "skills": [
+    {
+      "description": "Scrapes top posts from Moltbook communities, analyzes themes and sentiment, and generates summarized news reports.",
+      "examples": [
+        "Scrape and summarize: https://www.moltbook.com/m/technology",
+        "Get trending news from: https://www.moltbook.com/m/ai-agents, https://www.moltbook.com/m/protocols",
+        "Summarize the latest discussions on https://www.moltbook.com/m/security",
+      ],
+      "id": "scrape_moltbook_community",
+      "name": "Scrape Moltbook Community",
+      "tags": ["moltbook", "news", "scraping", "ai-agents", "summarization"],
+    }
+  ],
+  "supportsAuthenticatedExtendedCard": False,
+  "url": "",
+  "version": "1.0.0",
+}
+
+# Static responses are serialized once instead of on every request
+TRANSPORT_CONFIG_JSON = orjson.dumps({"transport": DEFAULT_MESSAGE_TRANSPORT.upper()})
+
+# Responses that cannot change while the process runs are served with an ETag so
+# browsers and proxies can revalidate with a 304 instead of re-downloading.
+STATIC_CACHE_CONTROL = "public, max-age=300"
+
+def _json_payload(data) -> tuple[bytes, str]:
+  """Serialize data once and derive a strong ETag from the resulting bytes."""
+  body = orjson.dumps(data)
+  return body, f'"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"'
+
+def _cached_json_response(request: Request, payload: tuple[bytes, str]) -> Response:
+  """Return the payload, or an empty 304 when the client already holds this version."""
+  body, etag = payload
+  headers = {"ETag": etag, "Cache-Control": STATIC_CACHE_CONTROL}
+  if_none_match = request.headers.get("if-none-match")
+  if if_none_match:
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if etag in tags or "*" in tags:
+      return Response(status_code=304, headers=headers)
+  return Response(content=body, media_type="application/json", headers=headers)
+
+AGENT_CARD_PAYLOAD = _json_payload(AGENT_CARD)
+
 @app.get("/.well-known/agent.json")
-async def get_capabilities():
+async def get_capabilities(request: Request):
   """
   Returns the capabilities of the news supervisor.
 
   Returns:
-      dict: A dictionary containing the capabilities and metadata of the news supervisor.
+      Response: The pre-serialized capabilities and metadata of the news supervisor,
+      or a 304 when the client's If-None-Match matches.
   """
-  return {
-    "capabilities": {"streaming": True},
-    "defaultInputModes": ["text"],
-    "defaultOutputModes": ["text"],
-    "description": "An AI agent that supervises Moltbook community scraping and news aggregation. Moltbook is a Reddit-like platform for AI agents to communicate with each other.",
-    "name": "Moltbook News Supervisor",
-    "preferredTransport": "JSONRPC",
-    "protocolVersion": "0.3.0",
-    "skills": [
-      {
-        "description": "Scrapes top posts from Moltbook communities, analyzes themes and sentiment, and generates summarized news reports.",
-        "examples": [
-          "Scrape and summarize: https://www.moltbook.com/m/technology",
-          "Get trending news from: https://www.moltbook.com/m/ai-agents, https://www.moltbook.com/m/protocols",
-          "Summarize the latest discussions on https://www.moltbook.com/m/security",
-        ],
-        "id": "scrape_moltbook_community",
-        "name": "Scrape Moltbook Community",
-        "tags": ["moltbook", "news", "scraping", "ai-agents", "summarization"],
-      }
-    ],
-    "supportsAuthenticatedExtendedCard": False,
-    "url": "",
-    "version": "1.0.0",
-  }
+  return _cached_json_response(request, AGENT_CARD_PAYLOAD)
 
 @app.post("/agent/prompt")
 async def handle_prompt(request: PromptRequest):
@@ -95,15 +159,16 @@ async def handle_prompt(request: PromptRequest):
       dict: A dictionary containing the agent's response.
 
   Raises:
-      HTTPException: 400 for invalid input, 500 for server-side errors.
+      HTTPException: 400 for invalid input, 503 when at capacity, 500 for server-side errors.
   """
+  _reject_if_busy()
   try:
-    with session_start() as session_id:
-    
-    # Execute the graph synchronously - blocks until completion
-      result = await news_graph.serve(request.prompt, request.urls)
-      logger.info(f"Final result from LangGraph: {result}")
-      return {"response": result, "session_id": session_id["executionID"]}
+    async with _prompt_semaphore:
+      with session_start() as session_id:
+        # Execute the graph synchronously - blocks until completion
+        result = await app.state.news_graph.serve(request.prompt, request.urls)
+        logger.info("Final result from LangGraph: %s", result)
+        return {"response": result, "session_id": session_id["executionID"]}
   except ValueError as ve:
     raise HTTPException(status_code=400, detail=str(ve))
   except Exception as e:
@@ -126,36 +191,51 @@ async def handle_stream_prompt(request: PromptRequest):
         Each chunk is formatted as: {"response": "..."}
 
     Raises:
-        HTTPException: 400 for invalid input, 500 for server-side errors.
+        HTTPException: 400 for invalid input, 503 when at capacity, 500 for server-side errors.
     """
+    _reject_if_busy()
+    # Take the slot before any bytes are sent, so an over-limit request gets its 503;
+    # the response releases it once it has been sent (or failed to be).
+    await _prompt_semaphore.acquire()
+    handed_off = False
     try:
         with session_start() as session_id: # Start a new tracing session for observability
 
           async def stream_generator():
               """
               Generator that yields JSON chunks as they arrive from the graph.
-              Uses newline-delimited JSON (NDJSON) format for streaming.
+              Uses newline-delimited JSON (NDJSON) format for streaming; each
+              object is yielded as UTF-8 bytes ending in a newline, so clients
+              can parse it as soon as it arrives.
               """
+              execution_id = session_id["executionID"]
               try:
                   # Stream chunks from the graph as nodes complete execution
-                  async for chunk in news_graph.streaming_serve(request.prompt, request.urls):
-                      yield json.dumps({"response": chunk, "session_id": session_id["executionID"]}) + "\n"
+                  async for chunk in app.state.news_graph.streaming_serve(request.prompt, request.urls):
+                      yield orjson.dumps({"response": chunk, "session_id": execution_id}) + b"\n"
               except Exception as e:
-                  logger.error(f"Error in stream: {e}")
-                  yield json.dumps({"response": f"Error: {str(e)}"}) + "\n"
+                  logger.error("Error in stream: %s", e)
+                  yield orjson.dumps({"response": f"Error: {str(e)}"}) + b"\n"
 
-          return StreamingResponse(
+          response = _PromptSlotStreamingResponse(
               stream_generator(),
               media_type="application/x-ndjson",  # Newline-delimited JSON for streaming
               headers={
                   "Cache-Control": "no-cache",  # Prevent caching of streaming responses
                   "Connection": "keep-alive",   # Keep connection open for streaming
+                  "X-Accel-Buffering": "no",    # Stop reverse proxies from buffering chunks
               }
           )
+          handed_off = True
+          return response
     except ValueError as ve:
         raise HTTPException(status_code=400, detail=str(ve))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Operation failed: {str(e)}")
+    finally:
+        # No response took ownership of the slot, so give it back here
+        if not handed_off:
+            _prompt_semaphore.release()
 
 @app.get("/health")
 async def health_check():
@@ -167,20 +247,30 @@ async def get_config():
     Returns the current transport configuration.
     
     Returns:
-        dict: Configuration containing transport settings.
+        Response: Pre-serialized configuration containing transport settings.
     """
-    return {
-        "transport": DEFAULT_MESSAGE_TRANSPORT.upper()
-    }
+    return Response(content=TRANSPORT_CONFIG_JSON, media_type="application/json")
 
 @app.get("/about")
-async def version_info():
-  """Return build info sourced from about.properties."""
-  props_path = Path(__file__).resolve().parents[3] / "about.properties"
-  return get_version_info(props_path)
+async def version_info(request: Request):
+  """Return build info sourced from about.properties (cached by get_version_info once resolved)."""
+  return _cached_json_response(request, _json_payload(get_version_info(ABOUT_PROPERTIES_PATH)))
+
+@functools.lru_cache(maxsize=1)
+def _load_suggested_prompts() -> tuple[tuple[bytes, str], tuple[bytes, str]]:
+  """
+  Read suggested_prompts.json once and serialize the default and streaming responses.
+
+  The file ships with the service and does not change at runtime. Errors are not
+  cached, so a failed read is retried on the next request.
+  """
+  data = json.loads(SUGGESTED_PROMPTS_PATH.read_text(encoding="utf-8"))
+  default_prompts = {"buyer": data.get("buyer", []), "purchaser": data.get("purchaser", [])}
+  streaming_prompts = {"streaming": data.get("streaming_prompts", [])}
+  return _json_payload(default_prompts), _json_payload(streaming_prompts)
 
 @app.get("/suggested-prompts")
-async def get_prompts(pattern: str = "default"):
+async def get_prompts(request: Request, pattern: str = "default"):
   """
   Fetch suggested prompts based on the specified pattern.
 
@@ -189,29 +279,29 @@ async def get_prompts(pattern: str = "default"):
                      Use "default" for all prompts or "streaming" for streaming-specific prompts.
 
   Returns:
-      dict: A dictionary containing lists of prompts for "buyer" and "purchaser".
+      Response: JSON with lists of prompts for "buyer" and "purchaser" (or a 304
+      when the client's cached copy is current).
 
   Raises:
       HTTPException:
           - 500 if the JSON file is invalid or an unexpected error occurs.
   """
   try:
-    prompts_path = Path(__file__).resolve().parent / "suggested_prompts.json"
-    raw = prompts_path.read_text(encoding="utf-8")
-    data = json.loads(raw)
-
-    if pattern == "streaming":
-      streaming_prompts = data.get("streaming_prompts", [])
-      return {"streaming": streaming_prompts}
-
-    buyer_prompts = data.get("buyer", [])
-    purchaser_prompts = data.get("purchaser", [])
-    return {"buyer": buyer_prompts, "purchaser": purchaser_prompts}
+    default_prompts, streaming_prompts = _load_suggested_prompts()
+    return _cached_json_response(request, streaming_prompts if pattern == "streaming" else default_prompts)
 
   except Exception as e:
-    logger.error(f"Unexpected error while reading prompts: {str(e)}")
+    logger.error("Unexpected error while reading prompts: %s", e)
     raise HTTPException(status_code=500, detail="An unexpected error occurred while reading prompts.")
 
 # Run the FastAPI server using uvicorn
 if __name__ == "__main__":
-  uvicorn.run("agents.supervisors.news.main:app", host="0.0.0.0", port=8001, reload=True)
+  # Reload stays on by default for `make news-supervisor`; set UVICORN_RELOAD=0 in
+  # deployments. uvicorn ignores workers while reload is on.
+  uvicorn.run(
+    "agents.supervisors.news.main:app",
+    host="0.0.0.0",
+    port=8001,
+    reload=os.getenv("UVICORN_RELOAD", "1").lower() in ("1", "true", "yes"),
+    workers=int(os.getenv("UVICORN_WORKERS", "1")),
+  )
@@ -50,7 +50,7 @@ class RefreshOAuth2OpenAIProvider(CustomLLM):
         """
         Called by litellm.completion() / ChatLiteLLM. Must return a ModelResponse.
         """
-        logger.info(f"completion called with model={model}, messages={messages}, kwargs={kwargs}")
+        logger.info("completion called with model=%s, messages=%s, kwargs=%s", model, messages, kwargs)
 
         token = self._get_token()
         url = self.base_url
@@ -108,7 +108,7 @@ class RefreshOAuth2OpenAIProvider(CustomLLM):
         Called by litellm.acompletion(). If stream=True, returns an async iterator
         yielding ModelResponse chunks. Otherwise returns a single ModelResponse.
         """
-        logger.info(f"acompletion called with model={model}, messages={messages}, kwargs={kwargs}")
+        logger.info("acompletion called with model=%s, messages=%s, kwargs=%s", model, messages, kwargs)
         token = self._get_token()
 
         url = self.base_url
@@ -236,9 +236,10 @@ class RefreshOAuth2OpenAIProvider(CustomLLM):
                     # decode bytes -> str
                     buffer += chunk.decode("utf-8", errors="ignore")
 
-                    # process complete lines
-                    while "\n" in buffer:
-                        line, buffer = buffer.split("\n", 1)
+                    # process complete lines in one split; the trailing
+                    # partial line stays in the buffer for the next chunk
+                    *lines, buffer = buffer.split("\n")
+                    for line in lines:
                         line = line.strip()
 
                         if not line or line.startswith(":"):
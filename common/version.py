@@ -4,13 +4,13 @@ Includes helpers to extract dependency versions and to derive a local
 git-based fallback for build version and date when running outside CI.
 """
 
-import configparser
 import json
 import logging
 import os
 import re
 import socket
 import subprocess
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -21,6 +21,25 @@ except Exception:
 
 logger = logging.getLogger(__name__)
 
+_PROJECT_ROOT = Path(__file__).parent.parent
+_PYPROJECT_PATH = _PROJECT_ROOT / "pyproject.toml"
+_COMPOSE_PATH = _PROJECT_ROOT / "docker-compose.yaml"
+
+_DEP_VERSION_RE = re.compile(r"(==|>=)\s*([^;\s]+)")
+_SLIM_IMAGE_RE = re.compile(r'ghcr\.io/agntcy/slim:(\d+\.\d+\.\d+)')
+_NATS_IMAGE_RE = re.compile(r'image:\s*nats:(\S+)')
+_SEMVER_PREFIX_RE = re.compile(r'^\d+\.\d+\.\d+')
+_ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+# Seconds before dependency info that could not be fully resolved is read again
+DEPENDENCY_RETRY_TTL = 60
+
+# (expiry time, dependencies) from the last get_dependencies() call
+_dependencies_cache: Optional[tuple[float, dict]] = None
+
+# (properties path, app, service) -> build metadata; only resolved versions are kept
+_build_info_cache: dict[tuple[str, str, str], dict] = {}
+
 
 DISPLAY_NAMES = {
     "agntcy-app-sdk": "AGNTCY App SDK",
@@ -38,7 +57,7 @@ def _extract_name_and_version(spec: str):
     """
     base = spec.split(';', 1)[0].strip()
     
-    match = re.search(r"(==|>=)\s*([^;\s]+)", base)
+    match = _DEP_VERSION_RE.search(base)
     if match:
         op, ver = match.group(1), match.group(2)
         name_part = base.split(op)[0].strip()
@@ -50,12 +69,31 @@ def _extract_name_and_version(spec: str):
 
 
 def get_dependencies():
-    """Get dependency versions from pyproject.toml and docker-compose.yaml"""
+    """Get dependency versions from pyproject.toml and docker-compose.yaml.
+
+    A complete result is cached for the process lifetime. If the NATS probe or
+    parsing failed, the fallback is only reused for DEPENDENCY_RETRY_TTL seconds
+    before trying again. Callers must not mutate the result.
+    """
+    global _dependencies_cache
+    now = time.monotonic()
+    if _dependencies_cache is not None and _dependencies_cache[0] > now:
+        return _dependencies_cache[1]
+
+    dependencies, complete = _read_dependencies()
+    expires_at = float("inf") if complete else now + DEPENDENCY_RETRY_TTL
+    _dependencies_cache = (expires_at, dependencies)
+    return dependencies
+
+
+def _read_dependencies() -> tuple[dict, bool]:
+    """Return the dependency versions and whether every lookup succeeded."""
     dependencies = {}
+    complete = True
     
     try:
         # Parse pyproject.toml for Python dependencies
-        pyproject_path = Path(__file__).parent.parent / "pyproject.toml"
+        pyproject_path = _PYPROJECT_PATH
         if pyproject_path.exists() and tomllib is not None:
             with open(pyproject_path, 'rb') as f:
                 data = tomllib.load(f)
@@ -70,16 +108,16 @@ def get_dependencies():
                         dependencies[display] = "unknown"
         
         # Get SLIM version from docker-compose.yaml
-        compose_path = Path(__file__).parent.parent / "docker-compose.yaml"
+        compose_path = _COMPOSE_PATH
         if compose_path.exists():
             with open(compose_path, 'r') as f:
                 content = f.read()
-                match = re.search(r'ghcr\.io/agntcy/slim:(\d+\.\d+\.\d+)', content)
+                match = _SLIM_IMAGE_RE.search(content)
                 if match:
                     dependencies['SLIM'] = f"v{match.group(1)}"
                 
                 # Get NATS version at runtime if using 'latest' tag
-                nats_match = re.search(r'image:\s*nats:(\S+)', content)
+                nats_match = _NATS_IMAGE_RE.search(content)
                 if nats_match:
                     nats_tag = nats_match.group(1)
                     if nats_tag == 'latest':
@@ -101,7 +139,7 @@ def get_dependencies():
                                 info_line = data.split('INFO ')[1].split('\r\n')[0]
                                 info = json.loads(info_line)
                                 version = info.get('version', '')
-                                if version and re.match(r'^\d+\.\d+\.\d+', str(version)):
+                                if version and _SEMVER_PREFIX_RE.match(str(version)):
                                     dependencies['NATS'] = f"v{version}"
                                 else:
                                     dependencies['NATS'] = nats_tag
@@ -109,13 +147,15 @@ def get_dependencies():
                                 dependencies['NATS'] = nats_tag
                         except Exception:
                             dependencies['NATS'] = nats_tag
+                            complete = False
                     else:
                         dependencies['NATS'] = f"v{nats_tag}" if not nats_tag.startswith('v') else nats_tag
         
     except Exception as e:
         logger.error(f"Error parsing dependencies: {e}")
+        complete = False
     
-    return dependencies
+    return dependencies, complete
 
 
 def _find_git_root(start: Path) -> Optional[Path]:
@@ -179,22 +219,38 @@ def _format_build_date(build_date: str) -> str:
 
     if ' ' in build_date:
         date_part = build_date.split(' ')[0]
-        if re.match(r'^\d{4}-\d{2}-\d{2}$', date_part):
+        if _ISO_DATE_RE.match(date_part):
             return date_part
     
     if 'T' in build_date:
         date_part = build_date.split('T')[0]
-        if re.match(r'^\d{4}-\d{2}-\d{2}$', date_part):
+        if _ISO_DATE_RE.match(date_part):
             return date_part
     
-    if re.match(r'^\d{4}-\d{2}-\d{2}$', build_date):
+    if _ISO_DATE_RE.match(build_date):
         return build_date
     
     return build_date
 
 
+def _read_properties(path: Path) -> dict:
+    """Parse a flat key=value properties file (keys lowercased, # and ; comments skipped)."""
+    props = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith(("#", ";")) or "=" not in line:
+            continue
+        key, _, value = line.partition("=")
+        props[key.strip().lower()] = value.strip()
+    return props
+
+
 def get_version_info(properties_file_path: Path, app_name: str = "lungo-exchange", service_name: str = "lungo-exchange") -> dict:
     """Get complete version information for the application.
+
+    Build metadata is cached per (resolved path, app, service) once its version is
+    known, since it cannot change while running. Errors and unknown versions are
+    not cached, and dependencies come from get_dependencies() on every call.
     
     Args:
         properties_file_path: Path to the about.properties file
@@ -203,69 +259,10 @@ def get_version_info(properties_file_path: Path, app_name: str = "lungo-exchange
         Dictionary containing app, service, version, build_date, build_timestamp, image, and dependencies
     """
     try:
-        expected_root = Path(__file__).parent.parent.resolve()
-        try:
-            properties_file_path.resolve().relative_to(expected_root)
-        except ValueError:
-            logger.warning(f"Properties file {properties_file_path} is outside expected path {expected_root}")
-            properties_file_path = expected_root / "about.properties"
-
-        # Try to read from about.properties first
-        if properties_file_path.exists():
-            config = configparser.ConfigParser()
-            with open(properties_file_path, "r") as f:
-                config_string = "[DEFAULT]\n" + f.read()
-            config.read_string(config_string)
-            
-            props = dict(config["DEFAULT"])
-
-            app_name_final = props.get("app.name", app_name)
-            service_final = props.get("app.service", service_name)
-            version = props.get("build.version", props.get("version", "unknown"))
-            build_date = props.get("build.date", props.get("date", "unknown"))
-            build_ts = props.get("build.timestamp", props.get("timestamp", "unknown"))
-            image_name = props.get("image.name", "unknown")
-            image_tag = props.get("image.tag", "unknown")
-            image = (
-                f"{image_name}:{image_tag}" if image_name != "unknown" and image_tag != "unknown" else image_name
-            )
-
-            # Fill in any missing values with git fallback
-            if version == "unknown" or build_date == "unknown" or build_ts == "unknown":
-                git_info = get_latest_tag_and_date(properties_file_path)
-                if git_info:
-                    if version == "unknown":
-                        version = git_info.get("tag", version)
-                    if build_date == "unknown":
-                        build_date = git_info.get("created_iso", build_date)
-                    if build_ts == "unknown":
-                        build_ts = git_info.get("created_unix", build_ts)
-
-            return {
-                "app": app_name_final,
-                "service": service_final,
-                "version": version,
-                "build_date": _format_build_date(build_date),
-                "build_timestamp": build_ts,
-                "image": image,
-                "dependencies": get_dependencies(),
-            }
-
-        # No about.properties file found - use git fallback
-        logger.error("No about.properties file found - metadata unavailable")
-        git_info = get_latest_tag_and_date(properties_file_path)
-        if git_info:
-            return {
-                "app": app_name,
-                "service": service_name,
-                "version": git_info.get("tag", "unknown"),
-                "build_date": _format_build_date(git_info.get("created_iso", "unknown")),
-                "build_timestamp": git_info.get("created_unix", "unknown"),
-                "image": "unknown",
-                "dependencies": get_dependencies(),
-            }
-
-        # No properties file and no git info
+        build_info = _get_build_info(str(properties_file_path.resolve()), app_name, service_name)
+        return {**build_info, "dependencies": get_dependencies()}
+    except Exception as e:
+        logger.error(f"Error getting version info: {e}")
         return {
             "app": app_name,
             "service": service_name,
@@ -273,17 +270,86 @@ def get_version_info(properties_file_path: Path, app_name: str = "lungo-exchange
             "build_date": "unknown",
             "build_timestamp": "unknown",
             "image": "unknown",
-            "dependencies": get_dependencies(),
+            "dependencies": {},
         }
 
-    except Exception as e:
-        logger.error(f"Error getting version info: {e}")
+
+def _get_build_info(properties_path: str, app_name: str, service_name: str) -> dict:
+    """Return build metadata without dependencies, caching it once the version is known."""
+    key = (properties_path, app_name, service_name)
+    cached = _build_info_cache.get(key)
+    if cached is not None:
+        return cached
+    build_info = _read_build_info(properties_path, app_name, service_name)
+    if build_info["version"] != "unknown":
+        _build_info_cache[key] = build_info
+    return build_info
+
+
+def _read_build_info(properties_path: str, app_name: str, service_name: str) -> dict:
+    """Read build metadata from about.properties, falling back to git."""
+    properties_file_path = Path(properties_path)
+    expected_root = _PROJECT_ROOT.resolve()
+    try:
+        properties_file_path.resolve().relative_to(expected_root)
+    except ValueError:
+        logger.warning(f"Properties file {properties_file_path} is outside expected path {expected_root}")
+        properties_file_path = expected_root / "about.properties"
+
+    # Try to read from about.properties first
+    if properties_file_path.exists():
+        props = _read_properties(properties_file_path)
+
+        app_name_final = props.get("app.name", app_name)
+        service_final = props.get("app.service", service_name)
+        version = props.get("build.version", props.get("version", "unknown"))
+        build_date = props.get("build.date", props.get("date", "unknown"))
+        build_ts = props.get("build.timestamp", props.get("timestamp", "unknown"))
+        image_name = props.get("image.name", "unknown")
+        image_tag = props.get("image.tag", "unknown")
+        image = (
+            f"{image_name}:{image_tag}" if image_name != "unknown" and image_tag != "unknown" else image_name
+        )
+
+        # Fill in any missing values with git fallback
+        if version == "unknown" or build_date == "unknown" or build_ts == "unknown":
+            git_info = get_latest_tag_and_date(properties_file_path)
+            if git_info:
+                if version == "unknown":
+                    version = git_info.get("tag", version)
+                if build_date == "unknown":
+                    build_date = git_info.get("created_iso", build_date)
+                if build_ts == "unknown":
+                    build_ts = git_info.get("created_unix", build_ts)
+
+        return {
+            "app": app_name_final,
+            "service": service_final,
+            "version": version,
+            "build_date": _format_build_date(build_date),
+            "build_timestamp": build_ts,
+            "image": image,
+        }
+
+    # No about.properties file found - use git fallback
+    logger.error("No about.properties file found - metadata unavailable")
+    git_info = get_latest_tag_and_date(properties_file_path)
+    if git_info:
         return {
             "app": app_name,
             "service": service_name,
-            "version": "unknown",
-            "build_date": "unknown",
-            "build_timestamp": "unknown",
+            "version": git_info.get("tag", "unknown"),
+            "build_date": _format_build_date(git_info.get("created_iso", "unknown")),
+            "build_timestamp": git_info.get("created_unix", "unknown"),
             "image": "unknown",
-            "dependencies": {},
         }
+
+    # No properties file and no git info
+    return {
+        "app": app_name,
+        "service": service_name,
+        "version": "unknown",
+        "build_date": "unknown",
+        "build_timestamp": "unknown",
+        "image": "unknown",
+    }
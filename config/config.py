@@ -11,6 +11,20 @@ TRANSPORT_SERVER_ENDPOINT = os.getenv("TRANSPORT_SERVER_ENDPOINT", "nats://local
 
 FARM_BROADCAST_TOPIC = os.getenv("FARM_BROADCAST_TOPIC", "farm_broadcast")
 
+# Number of transports (and A2A clients) the news supervisor spreads worker requests over
+NEWS_TRANSPORT_POOL_SIZE = max(1, int(os.getenv("NEWS_TRANSPORT_POOL_SIZE", "4")))
+# Prompts the news supervisor runs at once; further requests get a 503
+PROMPT_CONCURRENCY = max(1, int(os.getenv("PROMPT_CONCURRENCY", "16")))
+# Comma-separated browser origins allowed to call the news supervisor (UI container and Vite dev server by default)
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv(
+        "CORS_ORIGINS",
+        "http://localhost:3000,http://127.0.0.1:3000,http://localhost:5173,http://127.0.0.1:5173",
+    ).split(",")
+    if origin.strip()
+]
+
 LLM_MODEL = os.getenv("LLM_MODEL", "")
 ## Oauth2 OpenAI Provider
 OAUTH2_CLIENT_ID= os.getenv("OAUTH2_CLIENT_ID", "")
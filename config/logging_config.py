@@ -2,19 +2,43 @@
 # SPDX-License-Identifier: Apache-2.0
 
 # logging_config.py
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 from config.config import LOGGING_LEVEL
 
+_listener: QueueListener | None = None
+
+def _stop_listener():
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+atexit.register(_stop_listener)
+
 def setup_logging():
+    global _listener
+
+    # Records are formatted and queued on the calling thread, then written to
+    # the stream by a background listener, so callers never block on I/O.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+
+    _stop_listener()
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
     logging.basicConfig(
         level=LOGGING_LEVEL,
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        handlers=[QueueHandler(log_queue)],
         force=True,
     )
 
     # Set specific logging levels for noisy libraries
-    logging.basicConfig(level=logging.INFO)  # default
     logging.getLogger("openai").setLevel(logging.WARNING)
     logging.getLogger("httpcore").setLevel(logging.WARNING)
     logging.getLogger("httpx").setLevel(logging.WARNING)
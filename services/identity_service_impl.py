@@ -2,6 +2,8 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pydantic import ValidationError
 import requests
 from typing import Dict, Any
@@ -14,6 +16,16 @@ from services.models import IdentityServiceApps, Badge, Policies
 MAX_RETRIES = 3
 RETRY_DELAY = 2  # Seconds between retries.
 
+# Dedicated pool for blocking identity service HTTP calls made from async code.
+# Keeps them off the loop's default executor and bounds in-flight requests.
+IDENTITY_MAX_WORKERS = 16
+_IDENTITY_POOL = ThreadPoolExecutor(max_workers=IDENTITY_MAX_WORKERS, thread_name_prefix="identity")
+
+async def _run_identity(fn, *args, **kwargs):
+  """Run a blocking identity service call on the dedicated thread pool."""
+  loop = asyncio.get_running_loop()
+  return await loop.run_in_executor(_IDENTITY_POOL, partial(fn, *args, **kwargs))
+
 class IdentityServiceImpl(IdentityService):
   def __init__(self, api_key: str, base_url: str):
     self.api_key = api_key  # Caller service API key.
@@ -123,7 +135,7 @@ class IdentityServiceImpl(IdentityService):
     url = f"{self.base_url}/v1alpha1/policies"
     headers = {"x-id-api-key": self.api_key}
 
-    response = requests.get(url, headers=headers)
+    response = await _run_identity(requests.get, url, headers=headers)
     if response.status_code != 200:
       raise ValueError(f"Failed to fetch policies: {response.status_code}, {response.text}")
 
@@ -7,6 +7,7 @@ Replace prior xprocess usage with these.
 """
 import os
 import re
+import socket
 import time
 import sys
 import pytest
@@ -61,15 +62,29 @@ _ACTIVE_RUNNERS = []
 
 # ---------------- utils ----------------
 
+# Environment shared by every agent process, snapshotted once at import
+_BASE_ENV = {
+    **os.environ,
+    "PYTHONPATH": str(LUNGO_DIR),
+    "ENABLE_HTTP": "true",
+    "FARM_BROADCAST_TOPIC": "farm_broadcast",
+    "PYTHONUNBUFFERED": "1",
+    "PYTHONFAULTHANDLER": "1",
+}
+
 def _base_env():
-    return {
-        **os.environ,
-        "PYTHONPATH": str(LUNGO_DIR),
-        "ENABLE_HTTP": "true",
-        "FARM_BROADCAST_TOPIC": "farm_broadcast",
-        "PYTHONUNBUFFERED": "1",
-        "PYTHONFAULTHANDLER": "1",
-    }
+    return dict(_BASE_ENV)
+
+def _wait_tcp(host, port, timeout=30.0):
+    """Poll until host:port accepts a TCP connection, or raise TimeoutError."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise TimeoutError(f"{host}:{port} not ready after {timeout}s")
 
 def _purge_modules(prefixes):
     to_delete = [m for m in list(sys.modules)
@@ -82,43 +97,38 @@ files = ["docker-compose.yaml"]
 if Path("docker-compose.override.yaml").exists():
     files.append("docker-compose.override.yaml")
 
+# Transports and observability backends, started with a single compose invocation
+SESSION_SERVICES = ["slim", "nats", "otel-collector", "clickhouse-server", "grafana"]
+
+# Host ports that must accept connections before tests start
+SESSION_READY_PORTS = {
+    "slim": 46357,
+    "nats": 4222,
+    "otel-collector": 4317,
+    "clickhouse-server": 8123,
+}
+
 @pytest.fixture(scope="session", autouse=True)
 def orchestrate_session_services():
     print("\n--- Setting up session level service integrations ---")
-    setup_transports()
-    setup_observability()
+    _startup_session_services()
     setup_identity()
     print("--- Session level service setup complete. Tests can now run ---")
     yield
     down(files)
 
-def setup_transports():
-    _startup_slim()
-    _startup_nats()
-
-def setup_observability():
-    _startup_otel_collector()
-    _startup_clickhouse()
-    _startup_grafana()
-
 def setup_identity():
     pass
 
-def _startup_slim():
-    up(files, ["slim"])
-
-def _startup_nats():
-    up(files, ["nats"])
-
-def _startup_grafana():
-    up(files, ["grafana"])
-
-def _startup_clickhouse():
-    up(files, ["clickhouse-server"])
-
-def _startup_otel_collector():
-    up(files, ["otel-collector"])
-    time.sleep(10)
+def _startup_session_services():
+    # One `docker compose up` parses the compose files once and starts the
+    # containers in parallel instead of paying the CLI startup per service.
+    up(files, SESSION_SERVICES)
+    # A running container is not necessarily listening yet (otel-collector has
+    # no healthcheck), so wait for the published ports to accept connections.
+    for service, port in SESSION_READY_PORTS.items():
+        _wait_tcp("127.0.0.1", port)
+        print(f"Service {service} is accepting connections on port {port}.")
 
 # ---------------- per-test config ----------------
 
@@ -238,7 +248,7 @@ def agents_up(request, transport_config):
 
 @pytest.fixture
 def auction_supervisor_client(transport_config, monkeypatch):
-    for k, v in _base_env().items():
+    for k, v in _BASE_ENV.items():
         monkeypatch.setenv(k, str(v))
     for k, v in transport_config.items():
         monkeypatch.setenv(k, v)
@@ -258,7 +268,7 @@ def auction_supervisor_client(transport_config, monkeypatch):
 
 @pytest.fixture
 def logistics_supervisor_client(transport_config, monkeypatch):
-    for k, v in _base_env().items():
+    for k, v in _BASE_ENV.items():
         monkeypatch.setenv(k, str(v))
     for k, v in transport_config.items():
         monkeypatch.setenv(k, v)
@@ -278,7 +288,7 @@ def logistics_supervisor_client(transport_config, monkeypatch):
 
 @pytest.fixture
 def helpdesk_client(transport_config, monkeypatch):
-    for k, v in _base_env().items():
+    for k, v in _BASE_ENV.items():
         monkeypatch.setenv(k, str(v))
     for k, v in transport_config.items():
         monkeypatch.setenv(k, v)
@@ -299,7 +309,7 @@ def helpdesk_client(transport_config, monkeypatch):
 
 @pytest.fixture
 def logistics_shipper_client(transport_config, monkeypatch):
-    for k, v in _base_env().items():
+    for k, v in _BASE_ENV.items():
         monkeypatch.setenv(k, str(v))
     for k, v in transport_config.items():
         monkeypatch.setenv(k, v)
@@ -321,7 +331,7 @@ def logistics_shipper_client(transport_config, monkeypatch):
 
 @pytest.fixture
 def logistics_farm_client(transport_config, monkeypatch):
-    for k, v in _base_env().items():
+    for k, v in _BASE_ENV.items():
         monkeypatch.setenv(k, str(v))
     for k, v in transport_config.items():
         monkeypatch.setenv(k, v)
@@ -344,7 +354,7 @@ def logistics_farm_client(transport_config, monkeypatch):
 
 @pytest.fixture
 def logistics_accountant_client(transport_config, monkeypatch):
-    for k, v in _base_env().items():
+    for k, v in _BASE_ENV.items():
         monkeypatch.setenv(k, str(v))
     for k, v in transport_config.items():
         monkeypatch.setenv(k, v)
@@ -7,7 +7,7 @@ import re
 from pathlib import Path
 import pytest
 
-from sentence_transformers import SentenceTransformer, util
+from sentence_transformers import util
 
 logger = logging.getLogger(__name__)
 
@@ -23,8 +23,6 @@ TRANSPORT_MATRIX = [
     ),
 ]
 
-model = SentenceTransformer('all-MiniLM-L6-v2')
-
 def get_semantic_similarity(text1, text2, model):
     embeddings1 = model.encode(text1, convert_to_tensor=True)
     embeddings2 = model.encode(text2, convert_to_tensor=True)
@@ -0,0 +1,33 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+
+import pytest
+
+from agents.supervisors.news import main as news_main
+
+
+def test_stream_prompt_slot_released_when_body_never_iterated():
+    """A stream whose start message cannot be sent must still give its prompt slot back."""
+
+    async def scenario():
+        response = await news_main.handle_stream_prompt(
+            news_main.PromptRequest(prompt="Scrape and summarize")
+        )
+        # The handler holds the slot until the response has been sent
+        assert news_main._prompt_semaphore._value == news_main.PROMPT_CONCURRENCY - 1
+
+        async def receive():
+            await asyncio.Event().wait()
+
+        async def send(message):
+            # Client went away before http.response.start, so the body is never iterated
+            raise OSError("client disconnected")
+
+        with pytest.raises(Exception):
+            await response({"type": "http", "asgi": {"spec_version": "2.4"}}, receive, send)
+
+    asyncio.run(scenario())
+
+    assert news_main._prompt_semaphore._value == news_main.PROMPT_CONCURRENCY